@@ -0,0 +1,101 @@
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+# Both children import what the analyzer process imports, then run the cb_qv
+# indicator pass on 500 GBM prices; they print import and per-call times in ms.
+PRELUDE = """
+import math, random, time
+started = time.perf_counter()
+"""
+
+PRICES = """
+imported = time.perf_counter()
+rng = random.Random(0)
+prices = [100.0]
+for _ in range(499):
+    prices.append(prices[-1] * math.exp(rng.gauss(0, 0.002)))
+"""
+
+REPORT = """
+calc_started = time.perf_counter()
+for _ in range({iterations}):
+    indicators = calculate(prices)
+assert indicators
+finished = time.perf_counter()
+print((imported - started) * 1000, (finished - calc_started) * 1000 / {iterations})
+"""
+
+LEGACY = PRELUDE + """
+import requests
+import numpy as np
+import pandas as pd
+import ta
+""" + PRICES + """
+def calculate(prices):
+    df = pd.DataFrame(prices, columns=['close'])
+    df['high'] = df['close'].rolling(2).max()
+    df['low'] = df['close'].rolling(2).min()
+    df['sma_20'] = ta.trend.sma_indicator(df['close'], window=20)
+    df['sma_50'] = ta.trend.sma_indicator(df['close'], window=50)
+    df['rsi'] = ta.momentum.RSIIndicator(df['close'], window=14).rsi()
+    df['atr'] = ta.volatility.AverageTrueRange(df['high'], df['low'], df['close']).average_true_range()
+    macd = ta.trend.MACD(df['close'])
+    df['macd_line'] = macd.macd()
+    df['signal_line'] = macd.macd_signal()
+    return df.iloc[-1].to_dict()
+""" + REPORT
+
+LEAN = PRELUDE + """
+from cb_qv import CryptoAnalyzer
+""" + PRICES + """
+calculate = CryptoAnalyzer([]).calculate_advanced_indicators
+""" + REPORT
+
+BASELINE = "print(0, 0)"
+
+
+def max_rss_mb(rusage) -> float:
+    # ru_maxrss is bytes on macOS and kilobytes on Linux
+    scale = 1024 * 1024 if sys.platform == 'darwin' else 1024
+    return rusage.ru_maxrss / scale
+
+
+def run_child(code: str):
+    """Run `code` in a fresh interpreter, return (wall ms, import ms, calc ms, peak RSS MB)"""
+    started = time.perf_counter()
+    process = subprocess.Popen([sys.executable, '-c', code], stdout=subprocess.PIPE,
+                               cwd=os.path.dirname(os.path.abspath(__file__)))
+    output = process.stdout.read()
+    _, status, rusage = os.wait4(process.pid, 0)
+    wall = (time.perf_counter() - started) * 1000
+    process.returncode = os.waitstatus_to_exitcode(status)
+    if process.returncode != 0:
+        raise RuntimeError(f"Benchmark child exited with {process.returncode}")
+    import_ms, calc_ms = (float(v) for v in output.split())
+    return wall, import_ms, calc_ms, max_rss_mb(rusage)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare startup time and RSS of the pandas/ta and lean runtimes')
+    parser.add_argument('--runs', type=int, default=5, help='Fresh processes per mode')
+    parser.add_argument('--iterations', type=int, default=100, help='Indicator passes per process')
+    args = parser.parse_args()
+
+    modes = {
+        'python': BASELINE,
+        'pandas+ta': LEGACY.format(iterations=args.iterations),
+        'lean (numpy)': LEAN.format(iterations=args.iterations),
+    }
+    print(f"{'mode':<14}{'wall ms':>10}{'import ms':>12}{'calc ms':>10}{'RSS MB':>10}")
+    for name, code in modes.items():
+        runs = [run_child(code) for _ in range(args.runs)]
+        wall, import_ms, calc_ms, rss = (statistics.median(column) for column in zip(*runs))
+        print(f"{name:<14}{wall:>10.1f}{import_ms:>12.1f}{calc_ms:>10.3f}{rss:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,19 @@
 import requests
-import pandas as pd
 import numpy as np
-import ta
+import lean_ta
 import time
 import os
 from collections import deque
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 
+from scheduler import BarScheduler
+
 class CryptoAnalyzer:
-    def __init__(self, symbols: List[str]):
+    def __init__(self, symbols: List[str], base_url: Optional[str] = None, rate_limit_backoff: float = 30):
         self.symbols = symbols
-        self.base_url = "https://api.coinbase.com/v2"
+        self.base_url = base_url or os.environ.get('COINBASE_API_URL', 'https://api.coinbase.com/v2')
+        self.rate_limit_backoff = rate_limit_backoff
         self.price_history = {symbol: {'1m': deque(maxlen=500)} for symbol in self.symbols}
         self.signals_history = {symbol: [] for symbol in self.symbols}
         self.last_signal_time = {symbol: datetime.min for symbol in self.symbols}
@@ -23,7 +25,7 @@ class CryptoAnalyzer:
             response = requests.get(url, timeout=10)
             
             if response.status_code == 429:  # Rate limit handling
-                time.sleep(30)  # Back off for 30 seconds
+                time.sleep(self.rate_limit_backoff)  # Back off (30 seconds by default)
                 return self.fetch_data(symbol)
                 
             if response.status_code != 200:
@@ -49,38 +51,29 @@ class CryptoAnalyzer:
             if len(prices) < 50:  # Ensure enough data points
                 return {}
                 
-            df = pd.DataFrame(prices, columns=['close'])
+            close = np.asarray(prices, dtype=float)
             
             # Calculate high and low using close prices for ATR
-            df['high'] = df['close'].rolling(2).max()
-            df['low'] = df['close'].rolling(2).min()
+            high = lean_ta.rolling_max(close, 2)
+            low = lean_ta.rolling_min(close, 2)
             
             # Calculate technical indicators
-            df['sma_20'] = ta.trend.sma_indicator(df['close'], window=20)
-            df['sma_50'] = ta.trend.sma_indicator(df['close'], window=50)
-            df['rsi'] = ta.momentum.RSIIndicator(df['close'], window=14).rsi()
-            df['atr'] = ta.volatility.AverageTrueRange(
-                df['high'], df['low'], df['close']
-            ).average_true_range()
-            
-            macd = ta.trend.MACD(df['close'])
-            df['macd_line'] = macd.macd()
-            df['signal_line'] = macd.macd_signal()
+            macd_line, signal_line = lean_ta.macd(close)
+            latest = {
+                'rsi': lean_ta.rsi(close, window=14)[-1],
+                'macd_line': macd_line[-1],
+                'signal_line': signal_line[-1],
+                'sma_20': lean_ta.sma(close, 20)[-1],
+                'sma_50': lean_ta.sma(close, 50)[-1],
+                'atr': lean_ta.average_true_range(high, low, close)[-1]
+            }
             
             # Validate indicators
-            latest = df.iloc[-1]
-            if pd.isna(latest).any():
+            if np.isnan(list(latest.values())).any():
                 print("Invalid indicator calculations")
                 return {}
                 
-            return {
-                'rsi': latest['rsi'],
-                'macd_line': latest['macd_line'],
-                'signal_line': latest['signal_line'],
-                'sma_20': latest['sma_20'],
-                'sma_50': latest['sma_50'],
-                'atr': latest['atr']
-            }
+            return latest
         except Exception as e:
             print(f"Error calculating indicators: {e}")
             return {}
@@ -211,27 +204,38 @@ def main():
     # Initialize with major crypto pairs
     symbols = ['BTC-USD', 'ETH-USD', 'SOL-USD', 'AVAX-USD']
     analyzer = CryptoAnalyzer(symbols)
+    scheduler = BarScheduler(symbols, granularity=5, offset=0)
     print("Starting crypto analysis...")
     
     while True:
         try:
             for symbol in analyzer.symbols:
                 price = analyzer.fetch_data(symbol)
-                if price is not None:
-                    analyzer.price_history[symbol]['1m'].append(price)
-                    
-                    if len(analyzer.price_history[symbol]['1m']) >= 50:
-                        indicators = analyzer.calculate_advanced_indicators(
-                            list(analyzer.price_history[symbol]['1m'])
-                        )
-                        
-                        if indicators:
-                            signal = analyzer.generate_signal(indicators, price)
-                            if signal:
-                                analyzer.manage_trade(symbol, signal, price, indicators)
+                # Unchanged spot prices add nothing but flat bars (RSI=100, NaN stochastics)
+                if not scheduler.update(symbol, price):
+                    continue
+
+                analyzer.price_history[symbol]['1m'].append(price)
+                
+                if len(analyzer.price_history[symbol]['1m']) < 50:
+                    scheduler.mark_clean(symbol, recomputed=False)  # Still warming up
+                    continue
+
+                indicators = analyzer.calculate_advanced_indicators(
+                    list(analyzer.price_history[symbol]['1m'])
+                )
+                scheduler.mark_clean(symbol)
+                
+                if indicators:
+                    signal = analyzer.generate_signal(indicators, price)
+                    if signal:
+                        analyzer.manage_trade(symbol, signal, price, indicators)
                                 
-            time.sleep(5)
+            scheduler.wait_for_next_bar()
             
+        except KeyboardInterrupt:
+            print(scheduler.summary())
+            break
         except Exception as e:
             print(f"Error in main loop: {e}")
             time.sleep(30)  # Cool down on error
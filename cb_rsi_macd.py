@@ -1,12 +1,16 @@
 import requests
-import pandas as pd
-import ta
 import time
 import os
+import lean_ta
+from scheduler import BarScheduler
 
 # List of cryptocurrency trading pairs to monitor (use Coinbase product IDs)
 cryptos = ['BTC-USD', 'ETH-USD', 'SOL-USD', 'AVAX-USD', 'APT-USD', 'LINK-USD', 'RNDR-USD', 'SUI-USD', 'AR-USD', 'INJ-USD', 'TIA-USD']
 
+# Coinbase endpoints (override to point at a local stand-in such as fake_coinbase.py)
+COINBASE_API_URL = os.environ.get('COINBASE_API_URL', 'https://api.coinbase.com/v2')
+COINBASE_EXCHANGE_URL = os.environ.get('COINBASE_EXCHANGE_URL', 'https://api.exchange.coinbase.com')
+
 # Paths to default system sounds
 LONG_BEEP_FILE = '/System/Library/Sounds/Glass.aiff'  # Example sound for LONG
 SHORT_BEEP_FILE = '/System/Library/Sounds/Funk.aiff'  # Example sound for SHORT
@@ -19,7 +23,7 @@ def fetch_candlestick_data(product_id, granularity=60):
     :param granularity: Candlestick interval in seconds (e.g., 60 for 1 minute)
     :return: List of close prices
     """
-    url = f'https://api.exchange.coinbase.com/products/{product_id}/candles'
+    url = f'{COINBASE_EXCHANGE_URL}/products/{product_id}/candles'
     params = {
         'granularity': granularity  # Time interval in seconds (60 = 1 minute)
     }
@@ -36,7 +40,7 @@ def fetch_candlestick_data(product_id, granularity=60):
 
 # Function to fetch spot price from Coinbase (real-time)
 def fetch_spot_price(product_id):
-    url = f'https://api.coinbase.com/v2/prices/{product_id}/spot'
+    url = f'{COINBASE_API_URL}/prices/{product_id}/spot'
     response = requests.get(url)
     if response.status_code == 200:
         data = response.json()
@@ -48,20 +52,15 @@ def fetch_spot_price(product_id):
 def calculate_rsi(prices, window=14):
     if len(prices) < window:  # Ensure we have at least `window` data points
         return None
-    df = pd.DataFrame(prices, columns=['price'])
     # Calculate the RSI
-    df['rsi'] = ta.momentum.RSIIndicator(df['price'], window=window).rsi()
-    return df['rsi'].iloc[-1]
+    return lean_ta.rsi(prices, window=window)[-1]
 
 # Function to calculate MACD
 def calculate_macd(prices):
     if len(prices) < 35:  # Ensure we have enough data for MACD calculation
         return None, None
-    df = pd.DataFrame(prices, columns=['price'])
-    macd = ta.trend.MACD(df['price'], window_slow=26, window_fast=12, window_sign=9)
-    macd_line = macd.macd()
-    signal_line = macd.macd_signal()
-    return macd_line.iloc[-1], signal_line.iloc[-1]
+    macd_line, signal_line = lean_ta.macd(prices, window_slow=26, window_fast=12, window_sign=9)
+    return macd_line[-1], signal_line[-1]
 
 # Function to produce a long beep sound
 def long_beep():
@@ -84,15 +83,23 @@ def determine_position(rsi, macd, signal):
     else:
         return 'HOLD'  # No strong buy/sell signals
 
+# Poll once per 1-minute candle, a couple of seconds after it closes
+scheduler = BarScheduler(cryptos, granularity=60, offset=2)
+
 # Main loop to monitor cryptocurrencies
 while True:
     for product_id in cryptos:
         prices = fetch_candlestick_data(product_id, granularity=60)  # Fetch 1-minute candles
         
         if prices:
+            # Skip RSI/MACD when the candles are identical to the previous poll
+            if not scheduler.update(product_id, tuple(prices)):
+                continue
+
             # Calculate RSI and MACD
             rsi = calculate_rsi(prices)
             macd, signal = calculate_macd(prices)
+            scheduler.mark_clean(product_id)
             
             # Determine position based on RSI and MACD
             position = determine_position(rsi, macd, signal)
@@ -103,6 +110,7 @@ while True:
             else:
                 print(f'{product_id}: Position={position}, Latest Price={prices[-1]}, RSI={rsi}, MACD={macd}, Signal={signal}')
         else:
+            scheduler.update(product_id, None)
             # Fallback to real-time spot price if candlestick data fails
             spot_price = fetch_spot_price(product_id)
             if spot_price:
@@ -110,5 +118,6 @@ while True:
             else:
                 print(f'{product_id}: Unable to fetch prices. RSI=None, MACD=None, Position=NO DATA')
     
+    print(scheduler.summary())
     print('************************************')
-    time.sleep(60)  # Wait for 1 minute before fetching new data
+    scheduler.wait_for_next_bar()  # Wait for the next 1-minute candle to close
@@ -1,14 +1,18 @@
 import requests
-import pandas as pd
-import ta
 import time
 import os
+import lean_ta
 from collections import deque
 from datetime import datetime, timedelta
 
+from scheduler import BarScheduler
+
 # List of cryptocurrency symbols to monitor
 cryptos = ['SUI-USD', 'AVAX-USD', 'ETH-USD', 'BTC-USD', 'APT-USD', 'SOL-USD', 'AR-USD', 'INJ-USD', 'TIA-USD', 'LINK-USD', 'RNDR-USD']
 
+# Coinbase endpoint (override to point at a local stand-in such as fake_coinbase.py)
+COINBASE_API_URL = os.environ.get('COINBASE_API_URL', 'https://api.coinbase.com/v2')
+
 # Paths to default system sounds
 LONG_BEEP_FILE = '/System/Library/Sounds/Glass.aiff'
 SHORT_BEEP_FILE = '/System/Library/Sounds/Funk.aiff'
@@ -32,7 +36,7 @@ class ColorPrinter:
 
 # Function to fetch real-time data from Coinbase with retry logic
 def fetch_data(symbol, max_retries=3):
-    url = f'https://api.coinbase.com/v2/prices/{symbol}/spot'
+    url = f'{COINBASE_API_URL}/prices/{symbol}/spot'
     for attempt in range(max_retries):
         try:
             response = requests.get(url, timeout=10)
@@ -54,26 +58,23 @@ def calculate_indicators(prices):
     if len(prices) < 26:  # Ensure we have enough data for MACD
         return None, None, None, None, None, None, None
     
-    df = pd.DataFrame(prices, columns=['price'])
-    
     # RSI
-    df['rsi'] = ta.momentum.RSIIndicator(df['price'], window=14).rsi()
-    rsi = df['rsi'].rolling(window=3).mean().iloc[-1]  # Smoothed RSI
+    rsi = lean_ta.sma(lean_ta.rsi(prices, window=14), 3)[-1]  # Smoothed RSI
 
     # MACD
-    macd = ta.trend.MACD(df['price'])
-    macd_line = macd.macd().rolling(window=3).mean().iloc[-1]
-    macd_signal = macd.macd_signal().rolling(window=3).mean().iloc[-1]
+    macd, signal = lean_ta.macd(prices)
+    macd_line = lean_ta.sma(macd, 3)[-1]
+    macd_signal = lean_ta.sma(signal, 3)[-1]
 
     # Bollinger Bands
-    bb = ta.volatility.BollingerBands(df['price'], window=20, window_dev=2)
-    bb_high = bb.bollinger_hband().iloc[-1]
-    bb_low = bb.bollinger_lband().iloc[-1]
+    bb_high, bb_low = lean_ta.bollinger_bands(prices, window=20, window_dev=2)
+    bb_high = bb_high[-1]
+    bb_low = bb_low[-1]
 
     # Stochastic Oscillator
-    stoch = ta.momentum.StochasticOscillator(df['price'], df['price'], df['price'], window=14, smooth_window=3)
-    stoch_line = stoch.stoch().rolling(window=3).mean().iloc[-1]
-    stoch_signal = stoch.stoch_signal().rolling(window=3).mean().iloc[-1]
+    stoch, signal = lean_ta.stochastic(prices, prices, prices, window=14, smooth_window=3)
+    stoch_line = lean_ta.sma(stoch, 3)[-1]
+    stoch_signal = lean_ta.sma(signal, 3)[-1]
 
     return rsi, macd_line, macd_signal, bb_high, bb_low, stoch_line, stoch_signal
 
@@ -91,13 +92,15 @@ def main():
     price_history = {symbol: deque(maxlen=300) for symbol in cryptos}  # Larger buffer
     active_positions = {symbol: None for symbol in cryptos}
     last_update = {symbol: None for symbol in cryptos}
+    scheduler = BarScheduler(cryptos, granularity=10, offset=0)
 
     while True:
         for symbol in cryptos:
             try:
                 #ColorPrinter.print_info(f"Fetching data for {symbol}")
                 price = fetch_data(symbol)
-                if price is not None:
+                # Unchanged spot prices add nothing but flat bars (RSI=100, NaN stochastics)
+                if scheduler.update(symbol, price) and price is not None:
                     current_time = datetime.now()
                     last_update[symbol] = current_time
                     price_history[symbol].append(price)
@@ -106,6 +109,7 @@ def main():
                     # Only calculate if we have enough data and data is recent
                     if len(price_history[symbol]) >= 26 and (current_time - last_update[symbol] < timedelta(minutes=10)):  # Ensure data isn't too old
                         rsi, macd, macd_signal, bb_high, bb_low, stoch, stoch_signal = calculate_indicators(list(price_history[symbol]))
+                        scheduler.mark_clean(symbol)
                         
                         if None not in [rsi, macd, macd_signal, bb_high, bb_low, stoch, stoch_signal]:
                             indicators = {
@@ -145,10 +149,14 @@ def main():
                                 active_positions[symbol] = None
                         else:
                             ColorPrinter.print_warning(f"Could not calculate indicators for {symbol}")
+                    else:
+                        scheduler.mark_clean(symbol, recomputed=False)  # Still warming up
             except Exception as e:
+                scheduler.mark_clean(symbol, recomputed=False)
                 ColorPrinter.print_warning(f"An error occurred for {symbol}: {e}")
 
-        time.sleep(10)  # Check every 2 seconds
+        ColorPrinter.print_info(scheduler.summary())
+        scheduler.wait_for_next_bar()  # Check every 10 seconds
 
 if __name__ == "__main__":
     main()
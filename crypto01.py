@@ -1,12 +1,14 @@
 import requests
-import pandas as pd
-import ta
 import time
 import os
+import lean_ta
 
 # List of cryptocurrency trading pairs to monitor (use Coinbase product IDs)
 cryptos = ['BTC-USD', 'ETH-USD', 'SOL-USD', 'AVAX-USD', 'APT-USD', 'LINK-USD', 'RNDR-USD']
 
+# Coinbase endpoint (override to point at a local stand-in such as fake_coinbase.py)
+COINBASE_EXCHANGE_URL = os.environ.get('COINBASE_EXCHANGE_URL', 'https://api.exchange.coinbase.com')
+
 # Paths to default system sounds
 LONG_BEEP_FILE = '/System/Library/Sounds/Glass.aiff'  # Example sound for LONG
 SHORT_BEEP_FILE = '/System/Library/Sounds/Funk.aiff'  # Example sound for SHORT
@@ -19,7 +21,7 @@ def fetch_candlestick_data(product_id, granularity=60):
     :param granularity: Candlestick interval in seconds (e.g., 60 for 1 minute)
     :return: List of close prices
     """
-    url = f'https://api.exchange.coinbase.com/products/{product_id}/candles'
+    url = f'{COINBASE_EXCHANGE_URL}/products/{product_id}/candles'
     params = {
         'granularity': granularity  # Time interval in seconds (60 = 1 minute)
     }
@@ -39,9 +41,7 @@ def fetch_candlestick_data(product_id, granularity=60):
 def calculate_rsi(prices):
     if len(prices) < 14:  # Ensure we have at least 14 data points
         return None
-    df = pd.DataFrame(prices, columns=['price'])
-    df['rsi'] = ta.momentum.RSIIndicator(df['price'], window=14).rsi()
-    return df['rsi'].iloc[-1]
+    return lean_ta.rsi(prices, window=14)[-1]
 
 # Function to produce a long beep sound
 def long_beep():
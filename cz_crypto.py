@@ -1,19 +1,20 @@
 import requests
-import pandas as pd
 import numpy as np
-import ta
+import lean_ta
 import time
 import os
 from collections import deque
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 
+from scheduler import BarScheduler
+
 class CryptoAnalyzer:
     def __init__(self, symbols: List[str], timeframes: List[str] = ['1m', '5m', '15m']):
         # Coinbase API uses CRYPTO-USD format
         self.symbols = symbols  
         self.timeframes = timeframes  # Not used with Coinbase API, keeping for consistency
-        self.base_url = "https://api.coinbase.com/v2"
+        self.base_url = os.environ.get('COINBASE_API_URL', 'https://api.coinbase.com/v2')
         self.price_history = {
             symbol: {tf: deque(maxlen=500) for tf in timeframes}
             for symbol in self.symbols
@@ -45,15 +46,11 @@ class CryptoAnalyzer:
     def calculate_advanced_indicators(self, prices: List[float]) -> Dict[str, float]:
         """Calculate indicators based on price history"""
         try:
-            df = pd.DataFrame(prices, columns=['close'])
-            df['rsi'] = ta.momentum.RSIIndicator(df['close'], window=14).rsi()
-            macd = ta.trend.MACD(df['close'])
-            df['macd_line'] = macd.macd()
-            df['signal_line'] = macd.macd_signal()
+            macd_line, signal_line = lean_ta.macd(prices)
             return {
-                'rsi': df['rsi'].iloc[-1],
-                'macd_line': df['macd_line'].iloc[-1],
-                'signal_line': df['signal_line'].iloc[-1]
+                'rsi': lean_ta.rsi(prices, window=14)[-1],
+                'macd_line': macd_line[-1],
+                'signal_line': signal_line[-1]
             }
         except Exception as e:
             print(f"Error calculating indicators: {e}")
@@ -110,19 +107,27 @@ def main():
     timeframes = ['1m', '5m', '15m']  # Not used with Coinbase API, keeping for consistency
 
     analyzer = CryptoAnalyzer(symbols, timeframes)
+    scheduler = BarScheduler(symbols, granularity=5, offset=0)
     print("Starting crypto analysis...")
 
-    while True:
-        for symbol in analyzer.symbols:
-            price = analyzer.fetch_data(symbol)
-            if price is not None:
-                analyzer.price_history[symbol]['1m'].append(price)  # Use '1m' as a placeholder
-                if len(analyzer.price_history[symbol]['1m']) >= 14:  # Need 14 points for RSI
-                    indicators = analyzer.calculate_advanced_indicators(list(analyzer.price_history[symbol]['1m']))
-                    signal = analyzer.generate_signal(indicators)
-                    if signal:
-                        analyzer.log_signal(symbol, signal, price, indicators)
-        time.sleep(5)  # Wait between full cycles
+    try:
+        while True:
+            for symbol in analyzer.symbols:
+                price = analyzer.fetch_data(symbol)
+                # Unchanged spot prices add nothing but flat bars (RSI=100)
+                if scheduler.update(symbol, price) and price is not None:
+                    analyzer.price_history[symbol]['1m'].append(price)  # Use '1m' as a placeholder
+                    if len(analyzer.price_history[symbol]['1m']) >= 14:  # Need 14 points for RSI
+                        indicators = analyzer.calculate_advanced_indicators(list(analyzer.price_history[symbol]['1m']))
+                        scheduler.mark_clean(symbol)
+                        signal = analyzer.generate_signal(indicators)
+                        if signal:
+                            analyzer.log_signal(symbol, signal, price, indicators)
+                    else:
+                        scheduler.mark_clean(symbol, recomputed=False)  # Still warming up
+            scheduler.wait_for_next_bar()  # Wait between full cycles
+    except KeyboardInterrupt:
+        print(scheduler.summary())
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,298 @@
+import argparse
+import json
+import math
+import random
+import re
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Optional
+from urllib.parse import parse_qs, urlparse
+
+SECONDS_PER_YEAR = 365 * 24 * 3600
+SPOT_GRANULARITY = 60  # Spot prices walk between the 1-minute candle closes
+MAX_CANDLES = 300  # Coinbase returns at most 300 candles per request
+GRANULARITIES = {60, 300, 900, 3600, 21600, 86400}
+
+SPOT_PATH = re.compile(r'^/v2/prices/(?P<symbol>[A-Za-z0-9]+-[A-Za-z0-9]+)/spot$')
+CANDLES_PATH = re.compile(r'^/products/(?P<symbol>[A-Za-z0-9]+-[A-Za-z0-9]+)/candles$')
+
+
+class PriceModel:
+    """Deterministic geometric-Brownian-motion prices for any number of symbols.
+
+    Candle closes are drawn per (symbol, granularity, bar) from a seeded RNG and
+    cached, so a closed bar always comes back identical. The in-progress bar and
+    the spot price follow a Brownian bridge towards the next close and only move
+    once every `tick` seconds, like a quiet market on the real API.
+    """
+
+    def __init__(self, seed: int = 0, volatility: float = 0.8, drift: float = 0.0,
+                 tick: float = 1.0, clock: Callable[[], float] = time.time):
+        if tick <= 0:
+            raise ValueError(f"tick must be positive, got {tick}")
+        self.seed = seed
+        self.sigma = volatility / math.sqrt(SECONDS_PER_YEAR)  # Per-second volatility
+        self.mu = drift / SECONDS_PER_YEAR
+        self.tick = tick
+        self.clock = clock
+        self.origin = clock()
+        self.log_closes: Dict[tuple, Dict[int, float]] = {}
+        self.bounds: Dict[tuple, List[int]] = {}
+        self.lock = threading.Lock()
+
+    def _rng(self, *key) -> random.Random:
+        return random.Random(':'.join(str(part) for part in (self.seed,) + key))
+
+    def initial_price(self, symbol: str) -> float:
+        """Log-uniform starting price between 0.1 and 1000"""
+        return 10 ** self._rng(symbol).uniform(-1, 3)
+
+    def _step(self, symbol: str, granularity: int, bar: int) -> float:
+        shock = self._rng(symbol, granularity, bar).gauss(0, 1)
+        return (self.mu - self.sigma ** 2 / 2) * granularity + self.sigma * math.sqrt(granularity) * shock
+
+    def log_close(self, symbol: str, granularity: int, bar: int) -> float:
+        """Log close of `bar`, extending the cached path in either direction"""
+        key = (symbol, granularity)
+        with self.lock:
+            path = self.log_closes.get(key)
+            if path is None:
+                anchor = int(self.origin // granularity)
+                path = self.log_closes[key] = {anchor: math.log(self.initial_price(symbol))}
+                self.bounds[key] = [anchor, anchor]
+            lo, hi = self.bounds[key]
+            for i in range(hi + 1, bar + 1):
+                path[i] = path[i - 1] + self._step(symbol, granularity, i)
+            for i in range(lo - 1, bar - 1, -1):
+                path[i] = path[i + 1] - self._step(symbol, granularity, i + 1)
+            self.bounds[key] = [min(lo, bar), max(hi, bar)]
+            return path[bar]
+
+    def _bridge(self, symbol: str, granularity: int, now: float) -> float:
+        """Price inside the current bar, pinned to the previous and next closes"""
+        t = math.floor(now / self.tick) * self.tick
+        bar = int(t // granularity)
+        start = self.log_close(symbol, granularity, bar - 1)
+        end = self.log_close(symbol, granularity, bar)
+        f = (t - bar * granularity) / granularity
+        shock = self._rng(symbol, granularity, 'tick', round(t / self.tick)).gauss(0, 1)
+        noise = self.sigma * math.sqrt(granularity * f * (1 - f)) * shock
+        return math.exp(start + f * (end - start) + noise)
+
+    def spot(self, symbol: str, now: Optional[float] = None) -> float:
+        now = self.clock() if now is None else now
+        return self._bridge(symbol, SPOT_GRANULARITY, now)
+
+    def candles(self, symbol: str, granularity: int = 60, now: Optional[float] = None) -> List[list]:
+        """Candles as [time, low, high, open, close, volume], newest first like Coinbase"""
+        now = self.clock() if now is None else now
+        current = int(now // granularity)
+        candles = []
+        for bar in range(current, current - MAX_CANDLES, -1):
+            open_price = math.exp(self.log_close(symbol, granularity, bar - 1))
+            if bar == current:
+                close_price = self._bridge(symbol, granularity, now)
+            else:
+                close_price = math.exp(self.log_close(symbol, granularity, bar))
+            rng = self._rng(symbol, granularity, bar, 'range')
+            wick = self.sigma * math.sqrt(granularity) / 2
+            high = max(open_price, close_price) * math.exp(abs(rng.gauss(0, 1)) * wick)
+            low = min(open_price, close_price) * math.exp(-abs(rng.gauss(0, 1)) * wick)
+            candles.append([bar * granularity, low, high, open_price, close_price, rng.uniform(1, 1000)])
+        return candles
+
+
+class FaultRule:
+    """Return `status` for a fraction `rate` of requests between `start` and `end` seconds"""
+
+    def __init__(self, status: int, rate: float, start: float = 0.0, end: float = math.inf):
+        if not 0 <= rate <= 1:
+            raise ValueError(f"fault rate must be in [0, 1], got {rate}")
+        self.status = status
+        self.rate = rate
+        self.start = start
+        self.end = end
+
+    @classmethod
+    def parse(cls, spec: str) -> 'FaultRule':
+        """Parse `STATUS:RATE` or `STATUS:RATE@START-END`, e.g. `429:0.05` or `503:1@30-45`"""
+        match = re.fullmatch(r'(\d{3}):([0-9.]+)(?:@([0-9.]+)-([0-9.]+))?', spec.strip())
+        if not match:
+            raise ValueError(f"Invalid fault spec {spec!r}, expected STATUS:RATE[@START-END]")
+        status, rate, start, end = match.groups()
+        if start is None:
+            return cls(int(status), float(rate))
+        return cls(int(status), float(rate), float(start), float(end))
+
+    def active(self, elapsed: float) -> bool:
+        return self.start <= elapsed < self.end
+
+
+class FaultSchedule:
+    """Seeded fault injector; the first matching rule wins"""
+
+    def __init__(self, rules: Optional[List[FaultRule]] = None, seed: int = 0):
+        self.rules = rules or []
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+
+    def pick(self, elapsed: float) -> Optional[int]:
+        with self.lock:
+            for rule in self.rules:
+                if rule.active(elapsed) and self.rng.random() < rule.rate:
+                    return rule.status
+        return None
+
+
+class FakeCoinbaseHandler(BaseHTTPRequestHandler):
+    server_version = 'FakeCoinbase/1.0'
+
+    def do_GET(self):
+        server = self.server
+        url = urlparse(self.path)
+        if url.path == '/__stats':
+            self.reply(200, server.snapshot())
+            return
+
+        started = time.perf_counter()
+        server.inject_latency()
+
+        fault = server.faults.pick(time.time() - server.started_at)
+        if fault == 429:
+            status, body = 429, {'message': 'Too Many Requests'}
+        elif fault is not None:
+            status, body = fault, {'message': 'Internal server error'}
+        else:
+            status, body = self.route(url)
+        self.reply(status, body)
+        server.record(status, time.perf_counter() - started)
+
+    def reply(self, status: int, body):
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        if status == 429:
+            self.send_header('Retry-After', '1')
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def route(self, url):
+        spot = SPOT_PATH.match(url.path)
+        if spot:
+            symbol = spot.group('symbol')
+            base, currency = symbol.split('-')
+            price = self.server.model.spot(symbol)
+            return 200, {'data': {'amount': f'{price:.10g}', 'base': base, 'currency': currency}}
+
+        candles = CANDLES_PATH.match(url.path)
+        if candles:
+            params = parse_qs(url.query)
+            try:
+                granularity = int(params.get('granularity', ['60'])[0])
+            except ValueError:
+                granularity = -1
+            if granularity not in GRANULARITIES:
+                return 400, {'message': 'Unsupported granularity'}
+            return 200, self.server.model.candles(candles.group('symbol'), granularity)
+
+        return 404, {'message': 'NotFound'}
+
+    def log_message(self, format, *args):
+        pass  # Keep load tests quiet
+
+
+class FakeCoinbaseServer(ThreadingHTTPServer):
+    """Local stand-in for the Coinbase spot and candles endpoints"""
+
+    daemon_threads = True
+
+    def __init__(self, address=('127.0.0.1', 8765), model: Optional[PriceModel] = None,
+                 faults: Optional[FaultSchedule] = None, latency_ms: float = 0.0, jitter_ms: float = 0.0,
+                 seed: int = 0, backlog: int = 1024):
+        # The stdlib default listen backlog of 5 overflows under load and clients stall on SYN retransmits
+        self.request_queue_size = backlog
+        super().__init__(address, FakeCoinbaseHandler)
+        self.model = model or PriceModel(seed=seed)
+        self.faults = faults or FaultSchedule(seed=seed)
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.latency_rng = random.Random(seed)
+        self.started_at = time.time()
+        self.status_counts = Counter()
+        self.service_time = 0.0
+        self.stats_lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def inject_latency(self):
+        if self.latency_ms <= 0 and self.jitter_ms <= 0:
+            return
+        with self.stats_lock:
+            delay = self.latency_rng.gauss(self.latency_ms, self.jitter_ms)
+        time.sleep(max(delay, 0) / 1000)
+
+    def record(self, status: int, elapsed: float):
+        with self.stats_lock:
+            self.status_counts[status] += 1
+            self.service_time += elapsed
+
+    def snapshot(self) -> Dict[str, object]:
+        with self.stats_lock:
+            total = sum(self.status_counts.values())
+            return {
+                'requests': total,
+                'status_counts': {str(status): count for status, count in sorted(self.status_counts.items())},
+                'mean_service_ms': 1000 * self.service_time / total if total else 0.0,
+                'uptime': time.time() - self.started_at,
+            }
+
+    def start_in_background(self) -> threading.Thread:
+        thread = threading.Thread(target=self.serve_forever, daemon=True)
+        thread.start()
+        return thread
+
+
+def build_server(args) -> FakeCoinbaseServer:
+    model = PriceModel(seed=args.seed, volatility=args.volatility, drift=args.drift, tick=args.tick)
+    faults = FaultSchedule([FaultRule.parse(spec) for spec in args.fault], seed=args.seed)
+    return FakeCoinbaseServer((args.host, args.port), model=model, faults=faults,
+                              latency_ms=args.latency_ms, jitter_ms=args.jitter_ms, seed=args.seed,
+                              backlog=args.backlog)
+
+
+def add_server_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--volatility', type=float, default=0.8, help='Annualized GBM volatility')
+    parser.add_argument('--drift', type=float, default=0.0, help='Annualized GBM drift')
+    parser.add_argument('--tick', type=float, default=1.0, help='Seconds between spot price changes')
+    parser.add_argument('--latency-ms', type=float, default=0.0, help='Mean injected latency per request')
+    parser.add_argument('--jitter-ms', type=float, default=0.0, help='Std deviation of injected latency')
+    parser.add_argument('--backlog', type=int, default=1024, help='Listen backlog for pending connections')
+    parser.add_argument('--fault', action='append', default=[], metavar='STATUS:RATE[@START-END]',
+                        help='Inject STATUS for RATE of requests, optionally only between START and END seconds')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Local fake Coinbase API for load testing')
+    add_server_arguments(parser)
+    server = build_server(parser.parse_args())
+    print(f"Fake Coinbase listening on {server.url}")
+    print(f"  export COINBASE_API_URL={server.url}/v2 COINBASE_EXCHANGE_URL={server.url}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print(f"Stats: {server.snapshot()}")
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
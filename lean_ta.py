@@ -0,0 +1,197 @@
+"""NumPy-only versions of the `ta` indicators used by the analyzers.
+
+Each function mirrors the matching `ta` class with `fillna=False` and returns a
+full float array, NaN where `ta` would return NaN, so `result[-1]` matches
+`Indicator(...).method().iloc[-1]`. pandas and ta are only imported inside
+`indicator_frame` and `compare_with_ta`, keeping them out of the polling
+processes.
+"""
+from typing import Dict, Sequence, Tuple
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+def _as_array(values: Sequence[float]) -> np.ndarray:
+    return np.asarray(values, dtype=float)
+
+
+def _rolling(values: Sequence[float], window: int, reducer) -> np.ndarray:
+    """Apply `reducer` over trailing windows; the first `window - 1` entries are NaN"""
+    values = _as_array(values)
+    out = np.full(len(values), np.nan)
+    if len(values) >= window:
+        out[window - 1:] = reducer(sliding_window_view(values, window), axis=-1)
+    return out
+
+
+def sma(values: Sequence[float], window: int) -> np.ndarray:
+    """Simple moving average, like `Series.rolling(window).mean()`"""
+    return _rolling(values, window, np.mean)
+
+
+def rolling_max(values: Sequence[float], window: int) -> np.ndarray:
+    return _rolling(values, window, np.max)
+
+
+def rolling_min(values: Sequence[float], window: int) -> np.ndarray:
+    return _rolling(values, window, np.min)
+
+
+def rolling_std(values: Sequence[float], window: int) -> np.ndarray:
+    """Population standard deviation (ddof=0) over trailing windows"""
+    return _rolling(values, window, np.std)
+
+
+def ema(values: Sequence[float], alpha: float, min_periods: int = 0) -> np.ndarray:
+    """Exponential moving average, like `Series.ewm(alpha=alpha, adjust=False).mean()`
+
+    Leading NaNs are skipped and the average is seeded with the first valid
+    value; `min_periods` counts valid observations from there. NaNs later in
+    the series hold the average and, as with pandas' default `ignore_na=False`,
+    keep decaying its weight so the next observation counts for more. (pandas
+    weights gaps differently at exactly alpha=0.5; no indicator here uses it.)
+    """
+    values = _as_array(values)
+    out = np.full(len(values), np.nan)
+    valid = np.flatnonzero(~np.isnan(values))
+    if not len(valid):
+        return out
+    start = valid[0]
+    average = values[start]
+    old_weight = 1.0
+    count = 0
+    # The recurrence is sequential; plain floats keep the loop cheap
+    for i, value in enumerate(values[start:].tolist(), start):
+        if count:
+            old_weight *= 1 - alpha
+        if value == value:  # Not NaN
+            if count:
+                average = (old_weight * average + alpha * value) / (old_weight + alpha)
+                old_weight = 1.0
+            count += 1
+        if count >= min_periods:
+            out[i] = average
+    return out
+
+
+def ema_span(values: Sequence[float], window: int) -> np.ndarray:
+    """`ta`'s `_ema`: span-based EMA that needs `window` observations"""
+    return ema(values, 2 / (window + 1), min_periods=window)
+
+
+def rsi(close: Sequence[float], window: int = 14) -> np.ndarray:
+    """`ta.momentum.RSIIndicator(close, window).rsi()`"""
+    close = _as_array(close)
+    diff = np.diff(close, prepend=np.nan)
+    up = np.where(diff > 0, diff, 0.0)
+    down = np.where(diff < 0, -diff, 0.0)
+    ema_up = ema(up, 1 / window, min_periods=window)
+    ema_down = ema(down, 1 / window, min_periods=window)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        relative_strength = ema_up / ema_down
+        return np.where(ema_down == 0, 100.0, 100 - (100 / (1 + relative_strength)))
+
+
+def macd(close: Sequence[float], window_slow: int = 26, window_fast: int = 12,
+         window_sign: int = 9) -> Tuple[np.ndarray, np.ndarray]:
+    """`ta.trend.MACD(close)` as (macd(), macd_signal())"""
+    macd_line = ema_span(close, window_fast) - ema_span(close, window_slow)
+    return macd_line, ema_span(macd_line, window_sign)
+
+
+def bollinger_bands(close: Sequence[float], window: int = 20,
+                    window_dev: float = 2) -> Tuple[np.ndarray, np.ndarray]:
+    """`ta.volatility.BollingerBands` as (bollinger_hband(), bollinger_lband())"""
+    mavg = sma(close, window)
+    mstd = rolling_std(close, window)
+    return mavg + window_dev * mstd, mavg - window_dev * mstd
+
+
+def stochastic(high: Sequence[float], low: Sequence[float], close: Sequence[float],
+               window: int = 14, smooth_window: int = 3) -> Tuple[np.ndarray, np.ndarray]:
+    """`ta.momentum.StochasticOscillator` as (stoch(), stoch_signal())"""
+    smin = rolling_min(low, window)
+    smax = rolling_max(high, window)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        stoch_k = 100 * (_as_array(close) - smin) / (smax - smin)
+    return stoch_k, sma(stoch_k, smooth_window)
+
+
+def average_true_range(high: Sequence[float], low: Sequence[float], close: Sequence[float],
+                       window: int = 14) -> np.ndarray:
+    """`ta.volatility.AverageTrueRange(high, low, close, window).average_true_range()`"""
+    high, low, close = _as_array(high), _as_array(low), _as_array(close)
+    prev_close = np.concatenate(([np.nan], close[:-1]))
+    # fmax skips NaN unless every term is NaN, like DataFrame.max(axis=1)
+    true_range = np.fmax(np.fmax(high - low, np.abs(high - prev_close)), np.abs(low - prev_close))
+    atr = [0.0] * len(close)
+    if len(close) < window:
+        return np.array(atr)
+    seed = true_range[:window]
+    seed = seed[~np.isnan(seed)]  # Series.mean() skips NaN
+    atr[window - 1] = seed.mean() if len(seed) else np.nan
+    true_range = true_range.tolist()
+    for i in range(window, len(atr)):
+        atr[i] = (atr[i - 1] * (window - 1) + true_range[i]) / window
+    return np.array(atr)
+
+
+def indicator_frame(prices: Sequence[float]):
+    """Export every lean indicator as a pandas DataFrame (imports pandas lazily)"""
+    import pandas as pd
+
+    close = _as_array(prices)
+    macd_line, signal_line = macd(close)
+    bb_high, bb_low = bollinger_bands(close)
+    stoch_line, stoch_signal = stochastic(close, close, close)
+    high, low = rolling_max(close, 2), rolling_min(close, 2)
+    return pd.DataFrame({
+        'close': close,
+        'sma_20': sma(close, 20),
+        'sma_50': sma(close, 50),
+        'rsi': rsi(close),
+        'macd_line': macd_line,
+        'signal_line': signal_line,
+        'bb_high': bb_high,
+        'bb_low': bb_low,
+        'stoch': stoch_line,
+        'stoch_signal': stoch_signal,
+        'atr': average_true_range(high, low, close),
+    })
+
+
+def compare_with_ta(prices: Sequence[float]) -> Dict[str, float]:
+    """Max absolute difference between each lean indicator and `ta` (imports pandas/ta lazily)"""
+    import pandas as pd
+    import ta
+
+    lean = indicator_frame(prices)
+    close = lean['close']
+    high, low = close.rolling(2).max(), close.rolling(2).min()
+    macd_ta = ta.trend.MACD(close)
+    bb_ta = ta.volatility.BollingerBands(close, window=20, window_dev=2)
+    stoch_ta = ta.momentum.StochasticOscillator(close, close, close, window=14, smooth_window=3)
+    reference = pd.DataFrame({
+        'sma_20': ta.trend.sma_indicator(close, window=20),
+        'sma_50': ta.trend.sma_indicator(close, window=50),
+        'rsi': ta.momentum.RSIIndicator(close, window=14).rsi(),
+        'macd_line': macd_ta.macd(),
+        'signal_line': macd_ta.macd_signal(),
+        'bb_high': bb_ta.bollinger_hband(),
+        'bb_low': bb_ta.bollinger_lband(),
+        'stoch': stoch_ta.stoch(),
+        'stoch_signal': stoch_ta.stoch_signal(),
+        'atr': ta.volatility.AverageTrueRange(high, low, close).average_true_range(),
+    })
+
+    differences = {}
+    for column in reference:
+        expected = reference[column].to_numpy(dtype=float)
+        actual = lean[column].to_numpy(dtype=float)
+        if not np.array_equal(np.isnan(expected), np.isnan(actual)):
+            differences[column] = float('inf')  # NaN in different places
+            continue
+        mask = ~np.isnan(expected)
+        differences[column] = float(np.max(np.abs(expected[mask] - actual[mask]), initial=0.0))
+    return differences
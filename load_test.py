@@ -0,0 +1,188 @@
+import argparse
+import contextlib
+import os
+import subprocess
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Dict, List, Optional
+
+import requests
+
+from cb_qv import CryptoAnalyzer
+from fake_coinbase import add_server_arguments
+from scheduler import BarScheduler
+
+KNOWN_SYMBOLS = ['BTC-USD', 'ETH-USD', 'SOL-USD', 'AVAX-USD', 'APT-USD', 'LINK-USD',
+                 'RNDR-USD', 'SUI-USD', 'AR-USD', 'INJ-USD', 'TIA-USD']
+
+
+def make_symbols(count: int) -> List[str]:
+    """Real product IDs first, then synthetic SYM0001-USD style pairs"""
+    symbols = KNOWN_SYMBOLS[:count]
+    symbols += [f'SYM{i:04d}-USD' for i in range(1, count - len(symbols) + 1)]
+    return symbols
+
+
+def percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def prime_history(analyzer: CryptoAnalyzer, exchange_url: str):
+    """Seed price history from 1-minute candles so indicators run from the first tick"""
+    for symbol in analyzer.symbols:
+        try:
+            response = requests.get(f'{exchange_url}/products/{symbol}/candles',
+                                    params={'granularity': 60}, timeout=10)
+            if response.status_code == 200:
+                closes = [candle[4] for candle in reversed(response.json())]  # Oldest first
+                analyzer.price_history[symbol]['1m'].extend(closes)
+        except requests.RequestException as e:
+            print(f"Error priming history for {symbol}: {e}")
+
+
+class LoadWorker(threading.Thread):
+    """Poll one shard of symbols through the same path as cb_qv.main()
+
+    `manage_trade` is left out on purpose: it sleeps on sound alerts and only
+    prints, so it would measure the terminal rather than the analyzer.
+    """
+
+    def __init__(self, analyzer: CryptoAnalyzer, shard: List[str], deadline: float, interval: float):
+        super().__init__(daemon=True)
+        self.analyzer = analyzer
+        self.shard = shard
+        self.deadline = deadline
+        self.interval = interval
+        self.scheduler = BarScheduler(shard, granularity=interval or 1, offset=0)
+        self.fetch_latencies: List[float] = []
+        self.signal_latencies: List[float] = []
+        self.signals = Counter()
+
+    def run(self):
+        while time.perf_counter() < self.deadline:
+            for symbol in self.shard:
+                if time.perf_counter() >= self.deadline:
+                    break
+                started = time.perf_counter()
+                price = self.analyzer.fetch_data(symbol)
+                self.fetch_latencies.append(time.perf_counter() - started)
+                if not self.scheduler.update(symbol, price):
+                    continue
+
+                history = self.analyzer.price_history[symbol]['1m']
+                history.append(price)
+                indicators = self.analyzer.calculate_advanced_indicators(list(history))
+                signal = self.analyzer.generate_signal(indicators, price) if indicators else None
+                self.scheduler.mark_clean(symbol)
+                self.signal_latencies.append(time.perf_counter() - started)
+                self.signals[signal or 'NONE'] += 1
+
+            if self.interval > 0:
+                self.scheduler.wait_for_next_bar()
+
+
+def start_server_process(args):
+    """Run fake_coinbase.py in its own interpreter so it doesn't compete with the workers for the GIL"""
+    command = [sys.executable, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fake_coinbase.py'),
+               '--host', args.host, '--port', str(args.port), '--seed', str(args.seed),
+               '--volatility', str(args.volatility), '--drift', str(args.drift), '--tick', str(args.tick),
+               '--latency-ms', str(args.latency_ms), '--jitter-ms', str(args.jitter_ms),
+               '--backlog', str(args.backlog)]
+    for spec in args.fault:
+        command += ['--fault', spec]
+    process = subprocess.Popen(command, stdout=subprocess.PIPE, text=True)
+    banner = process.stdout.readline()  # "Fake Coinbase listening on http://host:port"
+    if not banner.startswith('Fake Coinbase listening on '):
+        process.kill()
+        raise RuntimeError(f"fake_coinbase.py failed to start (exit code {process.wait()})")
+    return process, banner.split()[-1]
+
+
+def fetch_server_stats(url: str) -> Optional[Dict[str, object]]:
+    try:
+        return requests.get(f'{url}/__stats', timeout=10).json()
+    except (requests.RequestException, ValueError):
+        return None  # Not a fake_coinbase server
+
+
+def print_report(args, url: str, workers: List[LoadWorker], elapsed: float, server_stats):
+    fetch_latencies = [v for w in workers for v in w.fetch_latencies]
+    signal_latencies = [v for w in workers for v in w.signal_latencies]
+    signals = sum((w.signals for w in workers), Counter())
+    totals = Counter()
+    for worker in workers:
+        totals.update(worker.scheduler.report())
+
+    def latency_line(name, values):
+        ms = [1000 * v for v in values]
+        return (f"{name}: p50={percentile(ms, 50):.1f}ms p95={percentile(ms, 95):.1f}ms "
+                f"p99={percentile(ms, 99):.1f}ms max={max(ms, default=0):.1f}ms")
+
+    print(f"\n{'='*50}")
+    print(f"Load test: {args.symbols} symbols, {len(workers)} workers, {elapsed:.1f}s against {url}")
+    print(f"Polls: {totals['polls']} ({totals['polls'] / elapsed:.1f}/s), fetch failures: {totals['failed']}")
+    print(f"Ticks (indicators + generate_signal): {totals['recomputes']} ({totals['recomputes'] / elapsed:.1f}/s), "
+          f"skipped unchanged: {totals['skipped']}")
+    print(f"Signals: LONG={signals['LONG']} SHORT={signals['SHORT']} none={signals['NONE']}")
+    print(latency_line('Fetch latency', fetch_latencies))
+    print(latency_line('Signal latency', signal_latencies))
+    if server_stats:
+        print(f"Server: {server_stats['requests']} requests, status {server_stats['status_counts']}, "
+              f"mean service {server_stats['mean_service_ms']:.1f}ms")
+    print(f"{'='*50}\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Load-test CryptoAnalyzer against a fake Coinbase API')
+    parser.add_argument('--url', help='Existing fake_coinbase.py server; starts one in a subprocess if omitted')
+    parser.add_argument('--symbols', type=int, default=100, help='Number of symbols to poll')
+    parser.add_argument('--workers', type=int, default=8, help='Polling threads, each owning a shard of symbols')
+    parser.add_argument('--duration', type=float, default=30.0, help='Seconds to run')
+    parser.add_argument('--interval', type=float, default=0.0, help='Seconds between shard polls (0 = flat out)')
+    parser.add_argument('--backoff', type=float, default=1.0, help='Rate-limit backoff passed to CryptoAnalyzer')
+    parser.add_argument('--verbose', action='store_true', help='Show analyzer error output during the run')
+    add_server_arguments(parser)
+    parser.set_defaults(port=0)  # Ephemeral port for the spawned server
+    args = parser.parse_args()
+
+    server = None
+    if args.url:
+        url = args.url.rstrip('/')
+    else:
+        server, url = start_server_process(args)
+
+    symbols = make_symbols(args.symbols)
+    shards = [symbols[i::args.workers] for i in range(args.workers) if symbols[i::args.workers]]
+    print(f"Priming {len(symbols)} symbols from {url}...")
+
+    with contextlib.ExitStack() as output:
+        if not args.verbose:
+            # Discard rather than buffer: every 429/5xx prints a line
+            output.enter_context(contextlib.redirect_stdout(output.enter_context(open(os.devnull, 'w'))))
+        analyzers = [CryptoAnalyzer(shard, base_url=f'{url}/v2', rate_limit_backoff=args.backoff) for shard in shards]
+        for analyzer in analyzers:
+            prime_history(analyzer, url)
+
+        started = time.perf_counter()
+        workers = [LoadWorker(analyzer, analyzer.symbols, started + args.duration, args.interval)
+                   for analyzer in analyzers]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        elapsed = time.perf_counter() - started
+
+    print_report(args, url, workers, elapsed, fetch_server_stats(url))
+    if server is not None:
+        server.terminate()
+        server.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+import time
+from typing import Callable, Dict, Hashable, Iterable, Optional
+
+
+class BarScheduler:
+    """Align polling to candle-close boundaries and skip redundant recomputation.
+
+    Each symbol carries a dirty flag that is only raised when the data marker
+    passed to `update` differs from the last one seen (a new candle, a new
+    spot price, ...). Callers recompute indicators only while the flag is set
+    and clear it with `mark_clean`, so identical polls cost a comparison
+    instead of a full indicator pass.
+    """
+
+    def __init__(self, symbols: Iterable[str], granularity: float = 60, offset: float = 2.0,
+                 clock: Callable[[], float] = time.time,
+                 sleep: Callable[[float], None] = time.sleep):
+        if granularity <= 0:
+            raise ValueError(f"granularity must be positive, got {granularity}")
+        if not 0 <= offset < granularity:
+            raise ValueError(f"offset must be in [0, {granularity}), got {offset}")
+        self.granularity = granularity
+        self.offset = offset
+        self.clock = clock
+        self.sleep = sleep
+        self.last_marker: Dict[str, Optional[Hashable]] = {}
+        self.dirty: Dict[str, bool] = {}
+        self.stats: Dict[str, Dict[str, int]] = {}
+        for symbol in symbols:
+            self.add_symbol(symbol)
+
+    def add_symbol(self, symbol: str):
+        """Start tracking a symbol; its first update always counts as new data"""
+        self.last_marker.setdefault(symbol, None)
+        self.dirty.setdefault(symbol, False)
+        self.stats.setdefault(symbol, {'polls': 0, 'failed': 0, 'recomputes': 0, 'skipped': 0})
+
+    def next_run(self, now: Optional[float] = None) -> float:
+        """Timestamp of the next candle close plus the configured offset"""
+        now = self.clock() if now is None else now
+        bar_close = (now // self.granularity) * self.granularity
+        run_at = bar_close + self.offset
+        if run_at <= now:
+            run_at += self.granularity
+        return run_at
+
+    def seconds_until_next_run(self, now: Optional[float] = None) -> float:
+        now = self.clock() if now is None else now
+        return self.next_run(now) - now
+
+    def wait_for_next_bar(self) -> float:
+        """Sleep until just after the next candle closes, return the seconds slept"""
+        delay = self.seconds_until_next_run()
+        self.sleep(delay)
+        return delay
+
+    def update(self, symbol: str, marker: Hashable) -> bool:
+        """Record a poll for `symbol` and return True if it brought new data
+
+        A None marker is a failed fetch: it is counted as `failed`, not as skipped work.
+        """
+        self.add_symbol(symbol)
+        self.stats[symbol]['polls'] += 1
+        if marker is None:
+            self.stats[symbol]['failed'] += 1
+            return False
+        if marker != self.last_marker[symbol]:
+            self.last_marker[symbol] = marker
+            self.dirty[symbol] = True
+        elif not self.dirty[symbol]:
+            self.stats[symbol]['skipped'] += 1
+        return self.dirty[symbol]
+
+    def is_dirty(self, symbol: str) -> bool:
+        return self.dirty.get(symbol, False)
+
+    def mark_clean(self, symbol: str, recomputed: bool = True):
+        """Clear the dirty flag; pass recomputed=False when nothing was calculated (e.g. warm-up)"""
+        if self.dirty.get(symbol):
+            self.dirty[symbol] = False
+            if recomputed:
+                self.stats[symbol]['recomputes'] += 1
+
+    def report(self) -> Dict[str, int]:
+        """Aggregate poll/failure/recompute/skip counters across all symbols"""
+        totals = {'polls': 0, 'failed': 0, 'recomputes': 0, 'skipped': 0}
+        for counters in self.stats.values():
+            for key in totals:
+                totals[key] += counters[key]
+        return totals
+
+    def summary(self) -> str:
+        totals = self.report()
+        fetched = totals['polls'] - totals['failed']
+        skipped_pct = 100 * totals['skipped'] / fetched if fetched else 0.0
+        return (f"Scheduler: {totals['polls']} polls, {totals['failed']} failed, "
+                f"{totals['recomputes']} recomputes, {totals['skipped']} skipped ({skipped_pct:.1f}% of fetched)")
@@ -0,0 +1,151 @@
+import json
+import math
+import urllib.error
+import urllib.request
+
+import pytest
+
+from fake_coinbase import MAX_CANDLES, FakeCoinbaseServer, FaultRule, FaultSchedule, PriceModel
+
+START = 10_000 * 60 + 30.0  # Halfway through a 1-minute bar
+
+
+class FakeClock:
+    def __init__(self, now=START):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.mark.parametrize('spec, expected', [
+    ('429:0.05', (429, 0.05, 0.0, math.inf)),
+    ('503:1', (503, 1.0, 0.0, math.inf)),
+    (' 500:0.5 ', (500, 0.5, 0.0, math.inf)),
+    ('503:1@30-45', (503, 1.0, 30.0, 45.0)),
+])
+def test_fault_rule_parse_valid(spec, expected):
+    rule = FaultRule.parse(spec)
+    assert (rule.status, rule.rate, rule.start, rule.end) == expected
+
+
+@pytest.mark.parametrize('spec', ['', '429', '42:0.1', '429:', '429:abc', '429:0.1@30', '429:0.1@-45', '429:1.5'])
+def test_fault_rule_parse_invalid(spec):
+    with pytest.raises(ValueError):
+        FaultRule.parse(spec)
+
+
+def test_fault_rule_window():
+    rule = FaultRule.parse('503:1@30-45')
+    assert not rule.active(29.9)
+    assert rule.active(30)
+    assert rule.active(44.9)
+    assert not rule.active(45)
+
+
+def test_fault_schedule_rate_zero_never_fires():
+    schedule = FaultSchedule([FaultRule(429, 0.0)])
+    assert all(schedule.pick(elapsed) is None for elapsed in range(1000))
+
+
+def test_fault_schedule_rate_one_always_fires():
+    schedule = FaultSchedule([FaultRule(429, 1.0)])
+    assert all(schedule.pick(elapsed) == 429 for elapsed in range(1000))
+
+
+def test_fault_schedule_respects_window_and_rule_order():
+    schedule = FaultSchedule([FaultRule(503, 1.0, start=10, end=20), FaultRule(429, 1.0)])
+    assert schedule.pick(5) == 429
+    assert schedule.pick(15) == 503
+
+
+def test_closed_candle_is_stable_across_calls_and_clock_advances():
+    clock = FakeClock()
+    model = PriceModel(seed=1, clock=clock)
+
+    def closed_bar(candles):
+        return next(candle for candle in candles if candle[0] == (int(START // 60) - 1) * 60)
+
+    first = closed_bar(model.candles('X-USD', 60))
+    assert closed_bar(model.candles('X-USD', 60)) == first
+    clock.now += 5
+    assert closed_bar(model.candles('X-USD', 60)) == first
+    clock.now += 120
+    assert closed_bar(model.candles('X-USD', 60)) == first
+
+
+@pytest.mark.parametrize('granularity', [60, 300, 86400])
+def test_candles_newest_first_and_capped(granularity):
+    model = PriceModel(seed=1, clock=FakeClock())
+    candles = model.candles('X-USD', granularity)
+    times = [candle[0] for candle in candles]
+
+    assert len(candles) == MAX_CANDLES
+    assert times[0] == int(START // granularity) * granularity
+    assert times == sorted(times, reverse=True)
+    assert all(low <= min(open_, close) <= max(open_, close) <= high
+               for _, low, high, open_, close, _ in candles)
+
+
+def test_spot_equals_current_minute_close():
+    clock = FakeClock()
+    model = PriceModel(seed=1, clock=clock)
+    for _ in range(5):
+        assert model.spot('X-USD') == model.candles('X-USD', 60)[0][4]
+        clock.now += 7
+
+
+@pytest.fixture
+def server():
+    server = FakeCoinbaseServer(('127.0.0.1', 0))
+    server.start_in_background()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def get(server, path):
+    """Return (status, headers, decoded JSON body) without raising on HTTP errors"""
+    try:
+        response = urllib.request.urlopen(server.url + path, timeout=10)
+    except urllib.error.HTTPError as e:
+        response = e
+    with response:
+        return response.status, response.headers, json.loads(response.read())
+
+
+def test_spot_endpoint(server):
+    status, _, body = get(server, '/v2/prices/X-USD/spot')
+    assert status == 200
+    assert body['data']['base'] == 'X'
+    assert body['data']['currency'] == 'USD'
+    assert float(body['data']['amount']) > 0
+
+
+def test_candles_endpoint(server):
+    status, _, body = get(server, '/products/X-USD/candles?granularity=300')
+    assert status == 200
+    assert len(body) == MAX_CANDLES
+    assert all(len(candle) == 6 for candle in body)
+
+
+@pytest.mark.parametrize('query', ['?granularity=7', '?granularity=abc'])
+def test_candles_unsupported_granularity(server, query):
+    status, _, body = get(server, '/products/X-USD/candles' + query)
+    assert status == 400
+    assert body == {'message': 'Unsupported granularity'}
+
+
+@pytest.mark.parametrize('path', ['/', '/v2/prices/X-USD', '/v2/prices/XUSD/spot', '/products/X-USD/ticker'])
+def test_unknown_path_is_404(server, path):
+    status, _, _ = get(server, path)
+    assert status == 404
+
+
+def test_forced_rate_limit(server):
+    server.faults = FaultSchedule([FaultRule(429, 1.0)])
+    status, headers, body = get(server, '/v2/prices/X-USD/spot')
+    assert status == 429
+    assert headers['Retry-After'] == '1'
+    assert body == {'message': 'Too Many Requests'}
+    assert server.snapshot()['status_counts'] == {'429': 1}
@@ -0,0 +1,72 @@
+import math
+import random
+
+import pytest
+
+pytest.importorskip('numpy')
+pytest.importorskip('pandas')
+pytest.importorskip('ta')
+
+import lean_ta  # noqa: E402
+
+TOLERANCE = 1e-9
+
+
+def gbm_prices(count, seed=0, start=100.0, volatility=0.002):
+    rng = random.Random(seed)
+    prices = [start]
+    for _ in range(count - 1):
+        prices.append(prices[-1] * math.exp(rng.gauss(0, volatility)))
+    return prices
+
+
+def assert_matches_ta(prices, skip=()):
+    differences = lean_ta.compare_with_ta(prices)
+    assert differences, "compare_with_ta returned nothing"
+    mismatched = {name: diff for name, diff in differences.items()
+                  if name not in skip and not diff < TOLERANCE}
+    assert not mismatched, f"lean_ta differs from ta: {mismatched}"
+
+
+@pytest.mark.parametrize('count', [500, 60])
+def test_matches_ta_on_gbm_series(count):
+    assert_matches_ta(gbm_prices(count, seed=count))
+
+
+def test_matches_ta_on_constant_series():
+    assert_matches_ta([5.0] * 80)
+
+
+def test_matches_ta_on_series_that_goes_flat():
+    prices = gbm_prices(60, seed=1)
+    prices += [prices[-1]] * 40
+    # pandas' rolling std leaves ~1e-7 of drift on a flat window, so check the bands against the exact value
+    assert_matches_ta(prices, skip=('bb_high', 'bb_low'))
+    bb_high, bb_low = lean_ta.bollinger_bands(prices)
+    assert bb_high[-1] == pytest.approx(prices[-1], abs=TOLERANCE)
+    assert bb_low[-1] == pytest.approx(prices[-1], abs=TOLERANCE)
+
+
+@pytest.mark.parametrize('count', [14, 26, 35])
+def test_matches_ta_through_warm_up(count):
+    # RSI, the MACD line and the MACD signal become valid at 14, 26 and 34 points
+    assert_matches_ta(gbm_prices(count, seed=count))
+
+
+@pytest.mark.parametrize('alpha', [1 / 14, 2 / 27, 2 / 13, 0.2, 0.3, 0.9])
+@pytest.mark.parametrize('min_periods', [0, 3])
+def test_ema_matches_pandas_across_nan_gaps(alpha, min_periods):
+    import numpy as np
+    import pandas as pd
+
+    nan = float('nan')
+    values = [nan, nan, 1, 2, nan, nan, 5, 6, nan, 4, nan, nan, nan, 9, 8]
+    expected = pd.Series(values).ewm(alpha=alpha, adjust=False, min_periods=min_periods).mean().to_numpy()
+    actual = lean_ta.ema(values, alpha, min_periods=min_periods)
+    np.testing.assert_allclose(actual, expected, rtol=0, atol=TOLERANCE)
+
+
+def test_ema_gap_weighting_example():
+    nan = float('nan')
+    result = lean_ta.ema([1, 2, nan, nan, 5, 6], 0.3)
+    assert result[-2:].tolist() == pytest.approx([3.0262830482, 3.9183981337], abs=1e-9)
@@ -0,0 +1,104 @@
+import pytest
+
+from scheduler import BarScheduler
+
+
+class FakeClock:
+    def __init__(self, now=0.0):
+        self.now = now
+        self.slept = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+def make_scheduler(now=0.0, granularity=60, offset=2):
+    clock = FakeClock(now)
+    return BarScheduler(['BTC-USD'], granularity=granularity, offset=offset, clock=clock, sleep=clock.sleep), clock
+
+
+def test_next_run_exactly_on_boundary():
+    scheduler, _ = make_scheduler(now=120.0)
+    assert scheduler.next_run() == 122.0
+
+
+def test_next_run_just_before_boundary():
+    scheduler, _ = make_scheduler(now=119.5)
+    assert scheduler.next_run() == 122.0
+
+
+def test_next_run_at_and_after_offset_moves_to_next_bar():
+    scheduler, _ = make_scheduler()
+    assert scheduler.next_run(121.9) == 122.0
+    assert scheduler.next_run(122.0) == 182.0
+    assert scheduler.next_run(122.5) == 182.0
+
+
+def test_wait_for_next_bar_sleeps_until_offset():
+    scheduler, clock = make_scheduler(now=125.0)
+    assert scheduler.wait_for_next_bar() == 57.0
+    assert clock.slept == [57.0]
+    assert clock.now == 182.0
+
+
+def test_update_counts_repeated_changed_and_missing_markers():
+    scheduler, _ = make_scheduler()
+
+    assert scheduler.update('BTC-USD', 100.0)  # First data is always new
+    scheduler.mark_clean('BTC-USD')
+    assert not scheduler.update('BTC-USD', 100.0)  # Repeated price
+    assert not scheduler.update('BTC-USD', None)  # Failed fetch is not skipped work
+    assert scheduler.update('BTC-USD', 101.0)  # Changed price
+    assert scheduler.is_dirty('BTC-USD')
+    scheduler.mark_clean('BTC-USD')
+    assert not scheduler.is_dirty('BTC-USD')
+
+    assert scheduler.report() == {'polls': 4, 'failed': 1, 'recomputes': 2, 'skipped': 1}
+
+
+def test_update_keeps_dirty_until_marked_clean():
+    scheduler, _ = make_scheduler()
+    assert scheduler.update('BTC-USD', 100.0)
+    assert scheduler.update('BTC-USD', 100.0)  # Pending recompute is not a skip
+    assert scheduler.report()['skipped'] == 0
+
+
+def test_mark_clean_without_recompute_is_not_counted():
+    scheduler, _ = make_scheduler()
+    scheduler.update('BTC-USD', 100.0)
+    scheduler.mark_clean('BTC-USD', recomputed=False)
+    assert not scheduler.is_dirty('BTC-USD')
+    assert scheduler.report() == {'polls': 1, 'failed': 0, 'recomputes': 0, 'skipped': 0}
+
+
+def test_failed_fetch_does_not_report_pending_data():
+    scheduler, _ = make_scheduler()
+    assert scheduler.update('BTC-USD', 100.0)
+    assert not scheduler.update('BTC-USD', None)  # Nothing to compute from
+    assert scheduler.is_dirty('BTC-USD')  # The earlier price is still pending
+    assert scheduler.report()['failed'] == 1
+
+
+def test_unknown_symbol_is_tracked_on_update():
+    scheduler, _ = make_scheduler()
+    assert scheduler.update('ETH-USD', 3000.0)
+    assert scheduler.stats['ETH-USD']['polls'] == 1
+
+
+def test_summary_reports_skipped_percentage():
+    scheduler, _ = make_scheduler()
+    scheduler.update('BTC-USD', 100.0)
+    scheduler.mark_clean('BTC-USD')
+    scheduler.update('BTC-USD', 100.0)
+    scheduler.update('BTC-USD', None)
+    assert scheduler.summary() == 'Scheduler: 3 polls, 1 failed, 1 recomputes, 1 skipped (50.0% of fetched)'
+
+
+@pytest.mark.parametrize('granularity, offset', [(0, 0), (-60, 0), (60, -1), (60, 60), (60, 90)])
+def test_rejects_bad_granularity_or_offset(granularity, offset):
+    with pytest.raises(ValueError):
+        BarScheduler(['BTC-USD'], granularity=granularity, offset=offset)